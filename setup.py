@@ -21,6 +21,9 @@ setup(
     install_requires=[
         "textual>=6.9.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.0"],
+    },
     entry_points={
         "console_scripts": [
             "todo=terminal_todo.app:main",
@@ -1,4 +1,9 @@
+import asyncio
 import json
+import os
+import pickle
+from functools import partial
+from itertools import count
 from pathlib import Path
 
 from textual import on
@@ -8,8 +13,80 @@ from textual.containers import VerticalScroll, Container, Center, Middle, Vertic
 from textual.message import Message
 from textual.events import Key
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DATA_DIR = Path.home() / ".terminal-todo"
 DATA_FILE = DATA_DIR / "data.json"
+JOURNAL_FILE = DATA_DIR / "journal.jsonl"
+CACHE_FILE = DATA_DIR / "data.cache.pkl"
+TAB_LOAD_DELAY = 0.05
+SAVE_DELAY = 0.3
+TASK_STATES = ("not_completed", "completed")
+IO_BUFFER_SIZE = 1024 * 1024
+
+
+def _dumps(data: dict) -> bytes:
+    """Encode data as compact UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes):
+    """Decode UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _number_tabs(saved_tabs: list) -> dict:
+    """Give saved tabs and their tasks the ids a freshly started app assigns them.
+
+    Tabs become t0, t1, ... and tasks are numbered from 0 in file order. Journal
+    events refer to tabs and tasks by these ids, so replay depends on it.
+    """
+    task_ids = count()
+    numbered = {}
+    for index, saved in enumerate(saved_tabs):
+        tasks = saved.get("tasks", {})
+        numbered[f"t{index}"] = {
+            "name": saved.get("name", "Tab"),
+            **{state: {next(task_ids): text for text in tasks.get(state, [])} for state in TASK_STATES},
+        }
+    return numbered
+
+
+def _replay_journal(numbered: dict, events: list) -> None:
+    """Apply journal events in place to tabs numbered by _number_tabs."""
+    for event in events:
+        op = event.get("op")
+        tab = numbered.get(event.get("tab"))
+        if op == "add_tab":
+            numbered[event["tab"]] = {"name": event["name"], **{state: {} for state in TASK_STATES}}
+        elif tab is None:
+            continue
+        elif op == "remove_tab":
+            del numbered[event["tab"]]
+        elif op == "add":
+            tab["not_completed"][event["task"]] = event["text"]
+        elif op == "move":
+            source = tab["completed" if event["to"] == "not_completed" else "not_completed"]
+            if event["task"] in source:
+                tab[event["to"]][event["task"]] = source.pop(event["task"])
+        elif op == "delete":
+            for state in TASK_STATES:
+                tab[state].pop(event["task"], None)
+
+
+def _saved_tabs(numbered: dict) -> list:
+    """Turn numbered tabs back into the data file's list of tabs."""
+    return [
+        {"name": tab["name"], "tasks": {state: list(tab[state].values()) for state in TASK_STATES}}
+        for tab in numbered.values()
+    ]
 
 
 class TaskRadioButton(RadioButton):
@@ -18,12 +95,19 @@ class TaskRadioButton(RadioButton):
     
     class DeleteRequest(Message):
         """Message to request deletion of this task."""
+        __slots__ = ("task_widget",)
+        
         def __init__(self, task_widget: "TaskRadioButton") -> None:
             self.task_widget = task_widget
             super().__init__()
     
     BINDINGS = [("q", "delete_task", "Delete")]
     
+    def __init__(self, raw_text: str, *args, task_id: int, **kwargs) -> None:
+        super().__init__(raw_text, *args, **kwargs)
+        self.raw_text = raw_text
+        self.task_id = task_id
+    
     def action_delete_task(self) -> None:
         """Request deletion of this task."""
         self.post_message(self.DeleteRequest(self))
@@ -49,13 +133,48 @@ class TodoApp(App):
                 ("k", "prev_task", ""),
             ]
     
+    _KEY_ACTIONS = {
+        "up": "prev_task",
+        "k": "prev_task",
+        "down": "next_task",
+        "j": "next_task",
+        "left": "prev_tab",
+        "h": "prev_tab",
+        "right": "next_tab",
+        "l": "next_tab",
+    }
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.tasks_by_tab = {}
+        self.theme = "dracula"
+        self.tasks = {}
         self.current_tab_id = None
         self.saved_tabs = []
+        self._numbered_tabs = {}
+        self._disk_tabs = []
+        self._revision = 0
         self.compact = True
+        self._make_not_completed = partial(TaskRadioButton, value=False, compact=self.compact)
+        self._make_completed = partial(TaskRadioButton, value=True, compact=True)
+        self._tab_order = []
+        self._tab_index = {}
+        self._tab_names = {}
+        self._containers_by_tab = {}
+        self._task_widgets = {}
+        self._nav_cache = None
+        self._nav_index = {}
+        self._not_completed = None
+        self._completed = None
+        self._pending_load = None
+        self._pending_events = []
+        self._journal_started = False
+        self._journal_fh = None
+        self._dirty = False
+        self._save_timer = None
+        self._save_lock = None
+        self._key_handlers = {key: getattr(self, f"action_{action}") for key, action in self._KEY_ACTIONS.items()}
         self._load_data()
+        self._init_tabs()
     
     @property
     def CSS_PATH(self):
@@ -67,314 +186,505 @@ class TodoApp(App):
         DATA_DIR.mkdir(parents=True, exist_ok=True)
         return DATA_FILE
     
+    def _new_tab_id(self) -> str:
+        """Return a short, unique id for a new tab."""
+        return f"t{next(self._tab_ids)}"
+    
+    def _set_tab_order(self, tab_order: list) -> None:
+        """Cache the tab ids in display order and each id's position."""
+        self._tab_order = tab_order
+        self._tab_index = {tab_id: index for index, tab_id in enumerate(tab_order)}
+    
+    def _init_tabs(self) -> None:
+        """Number the loaded tabs and fill the tasks dictionary before compose."""
+        numbered = self._numbered_tabs or _number_tabs([{"name": "Today"}])
+        for tab_id, saved in numbered.items():
+            self._tab_names[tab_id] = saved["name"]
+            for state in TASK_STATES:
+                self.tasks[(tab_id, state)] = saved[state]
+        # Continue after the highest ids in use so new journal ids stay unique. Ids are
+        # only dense when the tabs come straight from the data file.
+        self._tab_ids = count(max(int(tab_id[1:]) for tab_id in numbered) + 1)
+        self._task_ids = count(max((task_id for tasks in self.tasks.values() for task_id in tasks), default=-1) + 1)
+        self._set_tab_order(list(numbered))
+    
+    def _ensure_tab_tasks(self, tab_id: str) -> None:
+        """Make sure a tab has an entry for each task state."""
+        for state in TASK_STATES:
+            self.tasks.setdefault((tab_id, state), {})
+    
     def _load_data(self) -> None:
-        """Load tasks and tabs from persistent storage."""
+        """Load tasks and tabs from persistent storage, replaying any unsaved journal."""
+        self._load_snapshot()
+        self._disk_tabs = self.saved_tabs
+        self._numbered_tabs = _number_tabs(self.saved_tabs)
+        events = self._read_journal()
+        if not events:
+            self._discard_journal()
+            return
+        _replay_journal(self._numbered_tabs, events)
+        self.saved_tabs = _saved_tabs(self._numbered_tabs)
+        revision = self._revision
+        self._compact({"revision": revision + 1, "tabs": self.saved_tabs})
+        if self._revision != revision:
+            self._numbered_tabs = _number_tabs(self.saved_tabs)
+        else:
+            # The old journal is still the only record of these edits, so keep the ids it
+            # uses for this session and append to it; replay must see a single numbering.
+            self._journal_started = True
+    
+    def _load_snapshot(self) -> None:
+        """Load the tabs from the data file written at the last compaction."""
         data_path = self._get_data_path()
         self.saved_tabs = []
+        self._revision = 0
         if data_path.exists():
+            cache_key = self._data_cache_key(data_path)
+            cached = self._read_data_cache(cache_key)
+            if cached is not None:
+                self.saved_tabs, self._revision = cached
+                return
             try:
-                with open(data_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(data_path, "rb", buffering=IO_BUFFER_SIZE) as f:
+                    data = _loads(f.read())
+                    if not isinstance(data, dict):
+                        raise ValueError("data file does not hold a JSON object")
+                    self._revision = data.get("revision", 0)
                     if "tabs" in data:
-                        self.saved_tabs = data.get("tabs", [])
+                        self.saved_tabs = data["tabs"]
                     elif "tasks_by_tab" in data and "tab_names" in data:
                         tasks_by_tab = data.get("tasks_by_tab", {})
                         tab_names = data.get("tab_names", {})
                         migrated_tabs = []
                         for tab_id, tab_name in tab_names.items():
-                            tab_tasks = tasks_by_tab.get(tab_id, {"not_completed": [], "completed": []})
+                            tab_tasks = tasks_by_tab.get(tab_id, {})
                             migrated_tabs.append(
                                 {
                                     "name": tab_name,
                                     "tasks": {
-                                        "not_completed": list(tab_tasks.get("not_completed", [])),
-                                        "completed": list(tab_tasks.get("completed", [])),
+                                        "not_completed": tab_tasks.get("not_completed", []),
+                                        "completed": tab_tasks.get("completed", []),
                                     },
                                 }
                             )
                         self.saved_tabs = migrated_tabs
-            except (json.JSONDecodeError, IOError):
+            except (ValueError, IOError):
                 self.saved_tabs = []
+            else:
+                self._write_data_cache(cache_key, self.saved_tabs, self._revision)
+    
+    def _read_journal(self) -> list:
+        """Return the journal events recorded against the loaded snapshot."""
+        try:
+            with open(JOURNAL_FILE, "rb") as f:
+                lines = f.read().splitlines()
+        except IOError:
+            return []
+        events = []
+        for line in lines:
+            try:
+                events.append(_loads(line))
+            except ValueError:
+                # A line cut short by a crash ends the journal.
+                break
+        # A journal left over from an older snapshot is already part of the data file.
+        if not events or events[0] != {"op": "base", "revision": self._revision}:
+            return []
+        return events[1:]
+    
+    def _close_journal(self) -> None:
+        """Close the journal file if this session has it open."""
+        if self._journal_fh is not None:
+            self._journal_fh.close()
+            self._journal_fh = None
     
-    def _save_data(self) -> None:
-        """Schedule a save after the next refresh so the DOM is up to date."""
-        self.call_after_refresh(self._save_data_after_refresh)
+    def _discard_journal(self) -> None:
+        """Delete the journal once its events are part of the data file."""
+        self._close_journal()
+        try:
+            JOURNAL_FILE.unlink()
+        except FileNotFoundError:
+            pass
+        except IOError:
+            return
+        self._journal_started = False
+    
+    def _data_cache_key(self, data_path: Path) -> tuple:
+        """Identify the current version of the data file for the startup cache."""
+        try:
+            stat = data_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _read_data_cache(self, cache_key: tuple) -> tuple:
+        """Return the tabs and revision cached for this version of the data file, or None."""
+        if cache_key is None:
+            return None
+        try:
+            with open(CACHE_FILE, "rb") as f:
+                saved_key, saved_tabs, revision = pickle.load(f)
+        except Exception:
+            # A missing or unreadable cache only costs a JSON parse.
+            return None
+        return (saved_tabs, revision) if saved_key == cache_key else None
+    
+    def _write_data_cache(self, cache_key: tuple, saved_tabs: list, revision: int) -> None:
+        """Cache the parsed tabs so the next start can skip parsing the data file."""
+        if cache_key is None:
+            return
+        try:
+            with open(CACHE_FILE, "wb") as f:
+                pickle.dump((cache_key, saved_tabs, revision), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, IOError):
+            pass
+    
+    def _record(self, event: dict) -> None:
+        """Queue a change for the journal and schedule appending it."""
+        self._pending_events.append(event)
+        self._dirty = True
+        # Restart the delay on every change so a burst of edits is appended once.
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        self._save_timer = self.set_timer(SAVE_DELAY, self._flush_save)
 
-    def _save_data_after_refresh(self) -> None:
-        """Save tasks and tabs to persistent storage once the UI has settled."""
-        self._save_current_tasks()
+    async def _flush_save(self) -> None:
+        """Append the queued changes once edits have paused for SAVE_DELAY."""
+        self._save_timer = None
+        await self._flush_to_disk()
 
-        data_path = self._get_data_path()
+    async def _flush_to_disk(self) -> None:
+        """Append queued changes on a worker thread so the UI never blocks on disk I/O."""
+        events = self._pending_events
+        if not events:
+            return
+        self._pending_events = []
+        async with self._save_lock:
+            await asyncio.to_thread(self._append_journal, events)
+
+    def _append_journal(self, events: list) -> None:
+        """Append change events to the journal, one JSON object per line."""
+        if not self._journal_started:
+            # Tie the journal to the snapshot it applies to.
+            events = [{"op": "base", "revision": self._revision}, *events]
+        payload = b"".join(_dumps(event) + b"\n" for event in events)
+        try:
+            # The journal stays open for the session rather than being reopened per flush.
+            if self._journal_fh is None:
+                self._journal_fh = open(JOURNAL_FILE, "ab")
+            self._journal_fh.write(payload)
+            # Hand each batch to the OS so it survives the app being killed.
+            self._journal_fh.flush()
+        except IOError:
+            return
+        self._journal_started = True
 
-        tabs_widget = self.query_one(Tabs)
-        tabs_data = []
-        for tab in tabs_widget.query(Tab):
-            tab_id = tab.id
-            tab_name = str(tab.label)
-            tab_tasks = self.tasks_by_tab.get(tab_id, {"not_completed": [], "completed": []})
-            tabs_data.append(
+    def _snapshot(self) -> dict:
+        """Return the full state of the tabs, in the data file format."""
+        return {
+            "revision": self._revision + 1,
+            "tabs": [
                 {
-                    "name": tab_name,
-                    "tasks": {
-                        "not_completed": list(tab_tasks.get("not_completed", [])),
-                        "completed": list(tab_tasks.get("completed", [])),
-                    },
+                    "name": self._tab_names[tab_id],
+                    "tasks": {state: list(self.tasks.get((tab_id, state), {}).values()) for state in TASK_STATES},
                 }
-            )
+                for tab_id in self._tab_order
+            ],
+        }
+
+    def _compact(self, data: dict) -> None:
+        """Write a full snapshot to the data file and start a new, empty journal."""
+        if not self._write_data(data):
+            return
+        self._revision = data["revision"]
+        self._disk_tabs = data["tabs"]
+        self._discard_journal()
+        data_path = self._get_data_path()
+        self._write_data_cache(self._data_cache_key(data_path), data["tabs"], self._revision)
 
-        data = {"tabs": tabs_data}
-        self.saved_tabs = tabs_data
+    def _write_data(self, data: dict) -> bool:
+        """Write data to persistent storage and return whether it succeeded."""
+        data_path = self._get_data_path()
+        # Encode before opening so a serialization error can't truncate the file.
+        payload = _dumps(data)
+        tmp_path = data_path.with_suffix(".json.tmp")
         try:
-            with open(data_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except IOError:
-            pass
+            with open(tmp_path, "wb", buffering=IO_BUFFER_SIZE) as f:
+                f.write(payload)
+            # A crash mid-write leaves the old data file intact instead of a torn one.
+            # There is deliberately no fsync: losing the last moments of edits to a
+            # power cut is acceptable for a todo list, a stall on every save is not.
+            os.replace(tmp_path, data_path)
+        except OSError:
+            return False
+        return True
+
+    async def on_unmount(self) -> None:
+        """Flush queued changes and fold the journal into the data file before exiting."""
+        if self._save_timer is not None:
+            self._save_timer.stop()
+            self._save_timer = None
+        await self._flush_to_disk()
+        async with self._save_lock:
+            if self._dirty:
+                data = self._snapshot()
+                if data["tabs"] == self._disk_tabs:
+                    # The edits cancelled out, so the data file is already up to date.
+                    await asyncio.to_thread(self._discard_journal)
+                else:
+                    await asyncio.to_thread(self._compact, data)
+            # Still open if compaction failed; the journal is replayed next start.
+            self._close_journal()
     
-    async def on_mount(self) -> None:
-        self.query_one(Tabs).focus()
-        self.theme = "dracula"
-        self.query_one("#tab_modal").visible = False
+    def on_mount(self) -> None:
+        self._save_lock = asyncio.Lock()
+        self._tabs.focus()
         
-        tabs = self.query_one(Tabs)
-        
-        if self.saved_tabs:
-            first_tab_id = None
-            for saved in self.saved_tabs:
-                name = saved.get("name", "Tab")
-                tasks = saved.get("tasks", {})
-                await tabs.add_tab(name)
-                new_tab = list(tabs.query(Tab))[-1]
-                tab_id = new_tab.id
-                if first_tab_id is None:
-                    first_tab_id = tab_id
-                self.tasks_by_tab[tab_id] = {
-                    "not_completed": list(tasks.get("not_completed", [])),
-                    "completed": list(tasks.get("completed", [])),
-                }
-
-            if first_tab_id is not None:
-                tabs.active = first_tab_id
-                self.current_tab_id = first_tab_id
-                self._load_tasks_for_tab(first_tab_id)
-        else:
-            if tabs.tab_count == 0:
-                await tabs.add_tab("Today")
-            if tabs.active_tab:
-                self.current_tab_id = tabs.active_tab.id
-                if self.current_tab_id not in self.tasks_by_tab:
-                    self.tasks_by_tab[self.current_tab_id] = {"not_completed": [], "completed": []}
+        if not self.saved_tabs:
+            tab_id = self._tab_order[0]
+            self._record({"op": "add_tab", "tab": tab_id, "name": self._tab_names[tab_id]})
+        self.current_tab_id = self._tab_order[0]
+        self._show_tab(self.current_tab_id)
         
     def on_tabs_tab_activated(self, event: Tabs.TabActivated) -> None:
         """Handle TabActivated message sent by Tabs."""
-        if self.current_tab_id is not None:
-            self._save_current_tasks()
+        if event.tab is not None and event.tab.id not in self._tab_index:
+            # Queued before its tab was removed; the activation that followed the removal
+            # is still on its way.
+            return
+        if self._pending_load is not None:
+            self._pending_load.stop()
+            self._pending_load = None
         
         if event.tab is None:
             self.current_tab_id = None
         else:
             self.current_tab_id = event.tab.id
+            self._ensure_tab_tasks(self.current_tab_id)
             
-            if self.current_tab_id not in self.tasks_by_tab:
-                self.tasks_by_tab[self.current_tab_id] = {"not_completed": [], "completed": []}
-            
-            self._load_tasks_for_tab(self.current_tab_id)
+            if self.current_tab_id in self._containers_by_tab:
+                self._show_tab(self.current_tab_id)
+            else:
+                # Building a tab's widgets is the expensive part of a switch, so wait
+                # until the user stops flipping through tabs before doing it.
+                self._hide_current_tab()
+                self._pending_load = self.set_timer(
+                    TAB_LOAD_DELAY, partial(self._load_pending_tab, self.current_tab_id)
+                )
 
     def action_add(self) -> None:
         """Add a new tab."""
-        tab_modal = self.query_one("#tab_modal")
-        tab_modal.visible = True
-        self.query_one("#tab_input", Input).focus()
+        self._tab_modal.display = True
+        self._tab_input.focus()
     
     @on(Input.Submitted, "#tab_input")
     async def add_tab(self, event: Input.Submitted) -> None: 
-        tabs = self.query_one(Tabs)
         tab_name = event.value.strip()
-        if tab_name:
-            await tabs.add_tab(tab_name)
-            event.input.value = ""
-            self.query_one("#tab_modal").visible = False
-            tabs.focus()
-            if tabs.active_tab:
-                tab_id = tabs.active_tab.id
-                if tab_id not in self.tasks_by_tab:
-                    self.tasks_by_tab[tab_id] = {"not_completed": [], "completed": []}
-                self._save_data()
+        if not tab_name:
+            return
+        tabs = self._tabs
+        event.input.value = ""
+        self._tab_modal.display = False
+        tabs.focus()
+        new_tab = Tab(tab_name, id=self._new_tab_id())
+        await tabs.add_tab(new_tab)
+        self._set_tab_order([*self._tab_order, new_tab.id])
+        self._tab_names[new_tab.id] = tab_name
+        self._record({"op": "add_tab", "tab": new_tab.id, "name": tab_name})
+        self._ensure_tab_tasks(new_tab.id)
             
     def action_add_task(self) -> None:
         """Focus the task input box to add a new todo item."""
-        input_box = self.query_one("#task_input", Input)
-        input_box.focus()
+        self._task_input.focus()
 
     def action_remove(self) -> None:
         """Remove active tab."""
-        tabs = self.query_one(Tabs)
+        tabs = self._tabs
         active_tab = tabs.active_tab
         if active_tab is not None:
             tab_id = active_tab.id
-            if tab_id in self.tasks_by_tab:
-                del self.tasks_by_tab[tab_id]
+            for state in TASK_STATES:
+                for task_id in self.tasks.pop((tab_id, state), {}):
+                    self._task_widgets.pop(task_id, None)
+            for container in self._containers_by_tab.pop(tab_id, ()):
+                container.remove()
             tabs.remove_tab(tab_id)
-            if tabs.active_tab:
-                self.current_tab_id = tabs.active_tab.id
-            else:
-                self.current_tab_id = None
-            self._save_data()
+            self._set_tab_order([other for other in self._tab_order if other != tab_id])
+            del self._tab_names[tab_id]
+            self._record({"op": "remove_tab", "tab": tab_id})
+            # The next tab, if any, is picked up by on_tabs_tab_activated.
+            self.current_tab_id = None
+            self._hide_current_tab()
 
     def action_clear(self) -> None:
         """Clear the tabs."""
-        self.query_one(Tabs).clear()
+        self._tabs.clear()
+        self._set_tab_order([])
     
     def action_close_modal(self) -> None:
         """Close the tab modal if it's visible, or blur task input and focus first task."""
-        tab_modal = self.query_one("#tab_modal")
-        task_input = self.query_one("#task_input", Input)
-        
-        if tab_modal.visible:
-            tab_modal.visible = False
-            self.query_one("#tab_input", Input).value = ""
-            self.query_one(Tabs).focus()
-        elif self.focused == task_input:
-            not_completed = list(self.query_one("#not_completed_tasks").query(TaskRadioButton))
-            if not_completed:
-                not_completed[0].focus()
-                not_completed[0].scroll_visible()
+        if self._tab_modal.display:
+            self._tab_modal.display = False
+            self._tab_input.value = ""
+            self._tabs.focus()
+        elif self.focused == self._task_input and self._not_completed is not None:
+            # The container's children still hold widgets that are being removed, so
+            # take the first task from the tasks dictionary instead.
+            first_task_id = next(iter(self.tasks[(self.current_tab_id, "not_completed")]), None)
+            if first_task_id is not None:
+                task_widget = self._task_widgets[first_task_id]
+                task_widget.focus()
+                task_widget.scroll_visible()
             else:
-                self.query_one(Tabs).focus()
+                self._tabs.focus()
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
         input_box = Input(placeholder=" Enter a new todo item...", id="task_input")
-        not_completed_tasks = VerticalScroll(id="not_completed_tasks")
-        not_completed_tasks.border_title = "󰄱 To-Do"
-        completed_tasks = VerticalScroll(id="completed_tasks")
-        completed_tasks.border_title = " Completed"
-        tabs = Tabs()
+        tabs = Tabs(*[Tab(self._tab_names[tab_id], id=tab_id) for tab_id in self._tab_order])
+        self._task_input = input_box
+        self._tabs = tabs
 
         yield tabs
-        yield not_completed_tasks
-        yield completed_tasks
         yield input_box
         yield Footer()
         
-        with Container(id="tab_modal"):
+        with Container(id="tab_modal") as tab_modal:
             with Center():
                 with Middle():
                     with Container(id="tab_modal_content"):
                         yield Label(" Create New Tab", id="tab_modal_title")
-                        yield Input(placeholder="Enter tab name...", id="tab_input")
+                        tab_input = Input(placeholder="Enter tab name...", id="tab_input")
+                        yield tab_input
+        self._tab_modal = tab_modal
+        self._tab_input = tab_input
         
     @on(Input.Submitted, "#task_input")
-    def add_todo_item(self) -> None:
-        todo_text = self.query_one("#task_input", Input).value.strip()
-        if todo_text and self.current_tab_id is not None:
-            task = self.task_widget(todo_text)
-            self.query_one("#not_completed_tasks").mount(task)
-            self.query_one("#task_input", Input).value = ""
-            if self.current_tab_id in self.tasks_by_tab:
-                self.tasks_by_tab[self.current_tab_id]["not_completed"].append(str(todo_text))
-            self._save_data()
+    def add_todo_item(self, event: Input.Submitted) -> None:
+        todo_text = event.value.strip()
+        if not todo_text or self.current_tab_id is None:
+            return
+        task = self._make_not_completed(todo_text, task_id=next(self._task_ids))
+        if self._not_completed is not None:
+            self._not_completed.mount(task)
+            self._task_widgets[task.task_id] = task
+            self._nav_cache = None
+        event.input.value = ""
+        self.tasks[(self.current_tab_id, "not_completed")][task.task_id] = task.raw_text
+        self._record({"op": "add", "tab": self.current_tab_id, "task": task.task_id, "text": task.raw_text})
     
     @on(RadioButton.Changed)
     def on_radio_button_changed(self, event: RadioButton.Changed) -> None:
         task_widget = event.radio_button
-        task_text = task_widget.label
+        task_text = task_widget.raw_text
+        task_id = task_widget.task_id
         try:
-            if self.current_tab_id is not None and self.current_tab_id in self.tasks_by_tab:
-                if task_widget.value:
-                    self.query_one("#completed_tasks").mount(TaskRadioButton(label=task_text, value=True, compact=True))
-                    task_widget.remove()
-                    task_str = str(task_text)
-                    if task_str in self.tasks_by_tab[self.current_tab_id]["not_completed"]:
-                        self.tasks_by_tab[self.current_tab_id]["not_completed"].remove(task_str)
-                        self.tasks_by_tab[self.current_tab_id]["completed"].append(task_str)
-                else:
-                    self.query_one("#not_completed_tasks").mount(TaskRadioButton(label=task_text, value=False, compact=self.compact))
-                    task_widget.remove()
-                    task_str = str(task_text)
-                    if task_str in self.tasks_by_tab[self.current_tab_id]["completed"]:
-                        self.tasks_by_tab[self.current_tab_id]["completed"].remove(task_str)
-                        self.tasks_by_tab[self.current_tab_id]["not_completed"].append(task_str)
-                self._save_data()
+            if self.current_tab_id is not None:
+                # Textual can't move a mounted widget to another parent, so swap it
+                # for a new one in a single batch to get one refresh per toggle.
+                with self.batch_update():
+                    if task_widget.value:
+                        new_widget = self._make_completed(task_text, task_id=task_id)
+                        self._completed.mount(new_widget)
+                        task_widget.remove()
+                        self._move_task(task_id, "not_completed", "completed")
+                    else:
+                        new_widget = self._make_not_completed(task_text, task_id=task_id)
+                        self._not_completed.mount(new_widget)
+                        task_widget.remove()
+                        self._move_task(task_id, "completed", "not_completed")
+                self._task_widgets[task_id] = new_widget
+                self._nav_cache = None
             
         except Exception:
             pass
 
+    def _move_task(self, task_id: int, from_state: str, to_state: str) -> None:
+        """Move a task of the current tab between states in the tasks dictionary."""
+        task_text = self.tasks[(self.current_tab_id, from_state)].pop(task_id, None)
+        if task_text is not None:
+            self.tasks[(self.current_tab_id, to_state)][task_id] = task_text
+            self._record({"op": "move", "tab": self.current_tab_id, "task": task_id, "to": to_state})
     
-            
-    def _save_current_tasks(self) -> None:
-        """Save the current tasks displayed in the UI to the tasks dictionary."""
-        if self.current_tab_id is None or self.current_tab_id not in self.tasks_by_tab:
-            return
-        
-        self.tasks_by_tab[self.current_tab_id]["not_completed"] = []
-        self.tasks_by_tab[self.current_tab_id]["completed"] = []
-        
-        not_completed_container = self.query_one("#not_completed_tasks")
-        for task_widget in not_completed_container.query(TaskRadioButton):
-            self.tasks_by_tab[self.current_tab_id]["not_completed"].append(str(task_widget.label))
-        
-        completed_container = self.query_one("#completed_tasks")
-        for task_widget in completed_container.query(TaskRadioButton):
-            self.tasks_by_tab[self.current_tab_id]["completed"].append(str(task_widget.label))
+    def _hide_current_tab(self) -> None:
+        """Hide the task containers of the tab currently shown, if any."""
+        if self._not_completed is not None:
+            self._not_completed.display = False
+            self._completed.display = False
+            self._not_completed = None
+            self._completed = None
+            self._nav_cache = None
     
-    def _load_tasks_for_tab(self, tab_id: str) -> None:
-        """Load tasks for the specified tab from the tasks dictionary."""
-        if tab_id not in self.tasks_by_tab:
-            return
+    def _load_pending_tab(self, tab_id: str) -> None:
+        """Show a tab whose widgets were deferred, if it is still the active tab."""
+        self._pending_load = None
+        if tab_id == self.current_tab_id and (tab_id, "not_completed") in self.tasks:
+            self._show_tab(tab_id)
+    
+    def _show_tab(self, tab_id: str) -> None:
+        """Show the task containers for a tab, mounting them on first activation."""
+        containers = self._containers_by_tab.get(tab_id)
+        with self.batch_update():
+            self._hide_current_tab()
+            if containers is None:
+                containers = self._load_tasks_for_tab(tab_id)
+            else:
+                for container in containers:
+                    container.display = True
+        self._not_completed, self._completed = containers
+        self._nav_cache = None
+    
+    def _load_tasks_for_tab(self, tab_id: str) -> tuple:
+        """Create and mount the task containers for a tab from the tasks dictionary."""
+        not_completed_widgets = [
+            self._make_not_completed(task_text, task_id=task_id)
+            for task_id, task_text in self.tasks[(tab_id, "not_completed")].items()
+        ]
+        completed_widgets = [
+            self._make_completed(task_text, task_id=task_id)
+            for task_id, task_text in self.tasks[(tab_id, "completed")].items()
+        ]
         
-        not_completed_container = self.query_one("#not_completed_tasks")
-        completed_container = self.query_one("#completed_tasks")
-        not_completed_container.remove_children()
-        completed_container.remove_children()
+        for task_widget in (*not_completed_widgets, *completed_widgets):
+            self._task_widgets[task_widget.task_id] = task_widget
         
-        for task_text in self.tasks_by_tab[tab_id]["not_completed"]:
-            task_widget = TaskRadioButton(task_text, value=False, compact=self.compact)
-            not_completed_container.mount(task_widget)
+        not_completed_container = VerticalScroll(*not_completed_widgets, classes="not_completed_tasks")
+        not_completed_container.border_title = "󰄱 To-Do"
+        completed_container = VerticalScroll(*completed_widgets, classes="completed_tasks")
+        completed_container.border_title = " Completed"
+        self.mount(not_completed_container, completed_container, before=self._task_input)
         
-        for task_text in self.tasks_by_tab[tab_id]["completed"]:
-            task_widget = TaskRadioButton(task_text, value=True, compact=True)
-            completed_container.mount(task_widget)
-    
-    def task_widget(self, task: str) -> TaskRadioButton:
-        """Create a task widget for a todo task."""
-        return TaskRadioButton(task, value=False, compact=self.compact)
+        containers = (not_completed_container, completed_container)
+        self._containers_by_tab[tab_id] = containers
+        return containers
     
     @on(TaskRadioButton.DeleteRequest)
     def on_task_delete_request(self, event: TaskRadioButton.DeleteRequest) -> None:
         """Handle task deletion request."""
         task_widget = event.task_widget
-        task_text = task_widget.label
         
-        task_widget.remove()
-        
-        if self.current_tab_id and self.current_tab_id in self.tasks_by_tab:
-            task_str = str(task_text)
-            if task_str in self.tasks_by_tab[self.current_tab_id]["not_completed"]:
-                self.tasks_by_tab[self.current_tab_id]["not_completed"].remove(task_str)
-            elif task_str in self.tasks_by_tab[self.current_tab_id]["completed"]:
-                self.tasks_by_tab[self.current_tab_id]["completed"].remove(task_str)
-            self._save_data()
+        with self.batch_update():
+            task_widget.remove()
+            if self.current_tab_id is not None:
+                self._remove_from_model(task_widget.task_id)
+        self._task_widgets.pop(task_widget.task_id, None)
+        self._nav_cache = None
+    
+    def _remove_from_model(self, task_id: int) -> None:
+        """Remove a task of the current tab from the tasks dictionary."""
+        for state in TASK_STATES:
+            if self.tasks[(self.current_tab_id, state)].pop(task_id, None) is not None:
+                self._record({"op": "delete", "tab": self.current_tab_id, "task": task_id})
+                return
 
     def on_key(self, event: Key) -> None:
         """Handle key events globally to prevent scroll from capturing navigation keys."""
-        focused = self.focused
-        if isinstance(focused, Input):
+        handler = self._key_handlers.get(event.key)
+        if handler is None or isinstance(self.focused, Input):
             return
-        
-        if event.key in ("up", "down", "k", "j"):
-            event.prevent_default()
-            event.stop()
-            if event.key in ("up", "k"):
-                self.action_prev_task()
-            else:
-                self.action_next_task()
-        elif event.key in ("left", "right", "h", "l"):
-            event.prevent_default()
-            event.stop()
-            if event.key in ("left", "h"):
-                self.action_prev_tab()
-            else:
-                self.action_next_tab()
+        event.prevent_default()
+        event.stop()
+        handler()
     
     def action_toggle_dark(self) -> None:
         """An action to toggle dark mode."""
@@ -385,65 +695,70 @@ class TodoApp(App):
     def action_toggle_compact(self) -> None:
         """Toggle compact mode for not completed tasks."""
         self.compact = not self.compact
-        if self.current_tab_id is not None:
-            self._load_tasks_for_tab(self.current_tab_id)
+        self._make_not_completed = partial(TaskRadioButton, value=False, compact=self.compact)
+        for not_completed_container, _ in self._containers_by_tab.values():
+            for task_widget in not_completed_container.children:
+                task_widget.compact = self.compact
     
     def action_prev_tab(self) -> None:
         """Navigate to the previous tab."""
-        tabs = self.query_one(Tabs)
-        if tabs.tab_count > 0 and tabs.active_tab:
-            tab_ids = [tab.id for tab in tabs.query("Tab")]
-            current_index = tab_ids.index(tabs.active_tab.id)
-            new_index = (current_index - 1) % len(tab_ids)
-            tabs.active = tab_ids[new_index]
+        # Tabs.active changes immediately, unlike TabActivated, so repeated keys step
+        # from the right tab.
+        current_index = self._tab_index.get(self._tabs.active)
+        if current_index is not None:
+            self._tabs.active = self._tab_order[(current_index - 1) % len(self._tab_order)]
     
     def action_next_tab(self) -> None:
         """Navigate to the next tab."""
-        tabs = self.query_one(Tabs)
-        if tabs.tab_count > 0 and tabs.active_tab:
-            tab_ids = [tab.id for tab in tabs.query("Tab")]
-            current_index = tab_ids.index(tabs.active_tab.id)
-            new_index = (current_index + 1) % len(tab_ids)
-            tabs.active = tab_ids[new_index]
+        current_index = self._tab_index.get(self._tabs.active)
+        if current_index is not None:
+            self._tabs.active = self._tab_order[(current_index + 1) % len(self._tab_order)]
+    
+    def _nav_tasks(self) -> list:
+        """Return the shown tab's task widgets in navigation order.
+        
+        The list follows the tasks dictionary rather than the containers' children,
+        which still hold widgets that are being removed, and is cached until the
+        tasks or the shown tab change.
+        """
+        if self._nav_cache is None:
+            if self._not_completed is None:
+                return []
+            self._nav_cache = [
+                self._task_widgets[task_id]
+                for state in TASK_STATES
+                for task_id in self.tasks[(self.current_tab_id, state)]
+            ]
+            self._nav_index = {task_widget.task_id: index for index, task_widget in enumerate(self._nav_cache)}
+        return self._nav_cache
     
     def action_prev_task(self) -> None:
         """Navigate to the previous task."""
-        not_completed = list(self.query_one("#not_completed_tasks").query(TaskRadioButton))
-        completed = list(self.query_one("#completed_tasks").query(TaskRadioButton))
-        all_tasks = not_completed + completed
-        
+        all_tasks = self._nav_tasks()
         if not all_tasks:
             return
         
-        focused = self.focused
-        if isinstance(focused, TaskRadioButton) and focused in all_tasks:
-            current_index = all_tasks.index(focused)
-            prev_index = (current_index - 1) % len(all_tasks)
-            all_tasks[prev_index].focus()
-            all_tasks[prev_index].scroll_visible()
+        current_index = self._nav_index.get(getattr(self.focused, "task_id", None))
+        if current_index is not None:
+            task_widget = all_tasks[(current_index - 1) % len(all_tasks)]
         else:
-            all_tasks[-1].focus()
-            all_tasks[-1].scroll_visible()
+            task_widget = all_tasks[-1]
+        task_widget.focus()
+        task_widget.scroll_visible()
     
     def action_next_task(self) -> None:
         """Navigate to the next task."""
-        not_completed = list(self.query_one("#not_completed_tasks").query(TaskRadioButton))
-        completed = list(self.query_one("#completed_tasks").query(TaskRadioButton))
-        all_tasks = not_completed + completed
-        
+        all_tasks = self._nav_tasks()
         if not all_tasks:
             return
         
-        focused = self.focused
-        if isinstance(focused, TaskRadioButton) and focused in all_tasks:
-            current_index = all_tasks.index(focused)
-            next_index = (current_index + 1) % len(all_tasks)
-            all_tasks[next_index].focus()
-            all_tasks[next_index].scroll_visible()
+        current_index = self._nav_index.get(getattr(self.focused, "task_id", None))
+        if current_index is not None:
+            task_widget = all_tasks[(current_index + 1) % len(all_tasks)]
         else:
-            all_tasks[0].focus()
-            all_tasks[0].scroll_visible()
-
+            task_widget = all_tasks[0]
+        task_widget.focus()
+        task_widget.scroll_visible()
 
 def main():
     """Entry point for the terminal-todo command."""